@@ -1,4 +1,6 @@
+import sys
 import time
+from bisect import bisect_right
 # Replace with the actual GeekWorm UPS library import
 # Example: from ups_hat_library import UPS
 # Or use smbus/I2C if using direct I2C communication
@@ -27,32 +29,51 @@ class MockUPS:
 # Initialize UPS
 ups = MockUPS()  # replace MockUPS with actual UPS class
 
+# Percent at which each of the 4 green LEDs turns on
+LED_THRESHOLDS = (25, 50, 75, 100)
+# All 5 possible patterns, indexed by the number of thresholds reached
+LED_PATTERNS = tuple(
+    tuple('GREEN' if percent >= t else 'OFF' for t in LED_THRESHOLDS)
+    for percent in (0,) + LED_THRESHOLDS
+)
+
 def map_leds(percent):
     """Map battery percent to LED pattern."""
-    leds = ['OFF', 'OFF', 'OFF', 'OFF']  # 4 green LEDs
-    for i in range(4):
-        if percent >= (i+1)*25:
-            leds[i] = 'GREEN'
-    return leds
+    return list(LED_PATTERNS[bisect_right(LED_THRESHOLDS, percent)])
 
 def display_metrics():
     batt_percent = ups.get_batt_percent()
     led_status = map_leds(batt_percent)
 
-    print("------ GeekWorm UPS Status ------")
-    print(f"Battery Voltage: {ups.get_batt_voltage():.2f} V")
-    print(f"Battery Current: {ups.get_batt_current():.2f} A")
-    print(f"Battery Level: {batt_percent}%")
-    print(f"Battery LEDs: {led_status}")
-    print(f"Input Voltage: {ups.get_input_voltage():.2f} V")
-    print(f"Output Voltage: {ups.get_output_voltage():.2f} V")
-    print(f"Load Current: {ups.get_load_current():.2f} A")
-    print(f"Charging Status: {ups.get_charge_status()}")
-    print(f"Temperature: {ups.get_temperature():.1f} °C")
-    print(f"Power Events: {ups.get_power_events()}")
-    print("--------------------------------\n")
+    lines = [
+        "------ GeekWorm UPS Status ------",
+        f"Battery Voltage: {ups.get_batt_voltage():.2f} V",
+        f"Battery Current: {ups.get_batt_current():.2f} A",
+        f"Battery Level: {batt_percent}%",
+        f"Battery LEDs: {led_status}",
+        f"Input Voltage: {ups.get_input_voltage():.2f} V",
+        f"Output Voltage: {ups.get_output_voltage():.2f} V",
+        f"Load Current: {ups.get_load_current():.2f} A",
+        f"Charging Status: {ups.get_charge_status()}",
+        f"Temperature: {ups.get_temperature():.1f} °C",
+        f"Power Events: {ups.get_power_events()}",
+        "--------------------------------\n",
+    ]
+    # One write per frame instead of one print() per field
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def sleep_until_next(deadline: float, interval: float) -> float:
+    """Sleep until the monotonic `deadline`, skipping missed intervals; return the next one."""
+    now = time.monotonic()
+    if now > deadline:
+        deadline += ((now - deadline) // interval + 1) * interval
+    time.sleep(deadline - now)
+    return deadline + interval
 
 if __name__ == "__main__":
+    interval = 5  # refresh every 5 seconds
+    deadline = time.monotonic() + interval
     while True:
         display_metrics()
-        time.sleep(5)  # refresh every 5 seconds
\ No newline at end of file
+        deadline = sleep_until_next(deadline, interval)
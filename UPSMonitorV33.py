@@ -14,26 +14,87 @@ Features:
 - Keep-on-top option, 2-second auto refresh
 """
 
+import functools
+import math
 import time
 from datetime import datetime
+from typing import Optional
 import random  # Mocked data; replace with actual sensor readings
 import sys
-import os
+
+# ANSI cursor-home + clear-screen, written directly instead of forking `clear`
+_CLEAR = "\033[H\033[2J"
+
+# Below this load magnitude the runtime estimate is reported as infinite (idle)
+_MIN_LOAD_A = 1e-6
+
+# Watt-nanoseconds -> watt-hours (1 Wh = 3600 s * 1e9 ns)
+_WH_PER_WATT_NS = 1.0 / 3.6e12
 
 # -----------------------------
 # Helper functions for coloring
 # -----------------------------
-def color_text(text: str, color: str) -> str:
-    colors = {
-        "RED": "\033[91m",
-        "GREEN": "\033[92m",
-        "YELLOW": "\033[93m",
-        "ORANGE": "\033[33m",
-        "WHITE": "\033[97m",
-        "DIM": "\033[2m",
-        "RESET": "\033[0m"
-    }
-    return f"{colors.get(color.upper(),'')}{text}{colors['RESET']}"
+_ANSI = {
+    "RED": "\033[91m",
+    "GREEN": "\033[92m",
+    "YELLOW": "\033[93m",
+    "ORANGE": "\033[33m",
+    "WHITE": "\033[97m",
+    "DIM": "\033[2m",
+    "RESET": "\033[0m"
+}
+_ANSI_RESET = _ANSI["RESET"]
+
+def color_text(text: str, color: str, _t=_ANSI, _r=_ANSI_RESET) -> str:
+    """Wrap text in an ANSI color code; color names are uppercase keys of _ANSI"""
+    return f"{_t.get(color, '')}{text}{_r}"
+
+# -----------------------------
+# Refresh timing
+# -----------------------------
+def sleep_until_next(deadline: float, interval: float) -> float:
+    """Sleep until the monotonic `deadline`, skipping missed intervals; return the next one."""
+    now = time.monotonic()
+    if now > deadline:
+        deadline += ((now - deadline) // interval + 1) * interval
+    time.sleep(deadline - now)
+    return deadline + interval
+
+# -----------------------------
+# LED battery bands (top LED first)
+# -----------------------------
+_LED_THRESHOLDS = (76, 51, 26, 5)
+_LED_LABELS = ("LED4", "LED3", "LED2", "LED1")
+_LED_COLORS = ("GREEN", "YELLOW", "ORANGE", "RED")
+
+# -----------------------------
+# Dashboard layout (filled by UPSMonitor.display_dashboard)
+# -----------------------------
+_RULE = "-" * 60
+_DASH_TMPL = _CLEAR + (
+    "{header}\n"
+    "{shortcuts}\n"
+    f"{_RULE}\n"
+    "Voltage: {voltage:.2f}V\n"
+    "Battery Remaining: {percent}%\n"
+    "{leds}\n"
+    "AC Input Voltage: {ac_voltage:.2f}V\n"
+    "AC Input Current: {ac_current:.2f}A\n"
+    "DC Output Voltage: {dc_voltage:.2f}V\n"
+    "DC Output Current: {dc_current:.2f}A\n"
+    "Load Current: {load:.2f}A\n"
+    "Power Used: {power:.2f} W\n"
+    "CPU Temp: {cpu_temp:.1f}°C\n"
+    "AC Status: {ac_status}\n"
+    "Charge Status: {charge_status}\n"
+    f"{_RULE}\n"
+    "Total AC Time: {total_ac_time:.1f}s\n"
+    "Last Battery Time: {last_battery_time:.1f}s\n"
+    "Cumulative Battery Time: {cumulative_battery_time:.1f}s\n"
+    "Cumulative Energy: {cumulative_energy:.3f} Wh\n"
+    "Estimated Runtime: {estimated_runtime:.1f} min\n"
+    f"{_RULE}\n"
+)
 
 # -----------------------------
 # UPSMonitor Class
@@ -44,8 +105,10 @@ class UPSMonitor:
     Handles reading battery, AC/DC power, and displaying dashboard
     """
 
-    def __init__(self):
-        """Initialize monitor with mock values and counters"""
+    def __init__(self, read_sensors=None):
+        """Initialize monitor with mock values and counters.
+        read_sensors: optional callable(monitor) that fills the sensor fields from
+        real hardware; when omitted the mock update_sensors() is used."""
         self.battery_voltage: float = 3.97
         self.battery_percentage: int = 23
         self.battery_current: float = 1.2
@@ -61,34 +124,52 @@ class UPSMonitor:
         self.cumulative_battery_time: float = 0.0
         self.last_battery_time: float = 0.0
         self.cumulative_energy: float = 0.0
-        self.start_time: float = time.time()
+        self._last_ns: int = time.monotonic_ns()
         self.on_ac_power: bool = True
         self.keep_on_top: bool = False
         self.refresh_interval: float = 2.0
+        # Sensor source is picked once here rather than re-dispatched every frame
+        self._read_sensors = self.update_sensors if read_sensors is None else functools.partial(read_sensors, self)
+        # Without a terminal (service/log capture) only a compact line per frame is written
+        self._tty: bool = sys.stdout.isatty()
+        # Static banner lines never change, so color them once here
+        self._header: str = color_text("UPS Monitor v33", "WHITE")
+        self._shortcuts: str = color_text("F1R=Refresh | F1S=Snapshot | F1Q/F1A=Quit | F1L=Launch | F1K=Keep on top", "WHITE")
+        # Per-LED (threshold, lit %-template, dimmed line) with color codes baked in
+        self._led_templates: tuple = tuple(
+            (threshold,
+             f"{_ANSI[color]}{label}: %s%%{_ANSI_RESET}\n",
+             color_text(f"{label}: ---", "DIM") + "\n")
+            for threshold, label, color in zip(_LED_THRESHOLDS, _LED_LABELS, _LED_COLORS)
+        )
 
     # -----------------------------
     # Mock sensor readings (replace with actual sensors)
     # -----------------------------
     def update_sensors(self):
-        """Update sensor readings (mocked for testing)"""
-        self.battery_voltage = round(random.uniform(3.7, 4.2), 2)
+        """Update sensor readings (mocked for testing); values are kept unrounded, the display formats them"""
+        self.battery_voltage = random.uniform(3.7, 4.2)
         self.battery_percentage = random.randint(5, 100)
-        self.battery_current = round(random.uniform(0.5, 1.5), 2)
+        self.battery_current = random.uniform(0.5, 1.5)
         self.ac_input_voltage = 5.10
         self.ac_input_current = 0.8
         self.dc_output_voltage = 5.00
         self.dc_output_current = 0.8
         self.load_current = 0.8
-        self.cpu_temp = round(random.uniform(40.0, 50.0), 1)
-        self.on_ac_power = random.choice([True, False])
+        self.cpu_temp = random.uniform(40.0, 50.0)
+        self.on_ac_power = random.random() < 0.5  # coin flip without building a list
         self.charge_status = "Charging" if self.on_ac_power else "Discharging"
 
     # -----------------------------
     # Runtime calculations
     # -----------------------------
-    def update_runtime(self):
-        """Update cumulative times"""
-        elapsed = time.time() - self.start_time
+    def update_runtime(self, now_ns: Optional[int] = None):
+        """Update cumulative times; `now_ns` is the frame's time.monotonic_ns() timestamp"""
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        dt_ns = now_ns - self._last_ns
+        self._last_ns = now_ns
+        elapsed = dt_ns * 1e-9
         if self.on_ac_power:
             self.total_ac_time += elapsed
             if self.last_battery_time:
@@ -96,62 +177,82 @@ class UPSMonitor:
                 self.last_battery_time = 0
         else:
             self.last_battery_time += elapsed
-        self.cumulative_energy += self.load_current * self.dc_output_voltage * (elapsed / 3600)  # Wh
-        self.start_time = time.time()
+        self.cumulative_energy += self.load_current * self.dc_output_voltage * dt_ns * _WH_PER_WATT_NS
+
+    # -----------------------------
+    # Per-frame state update
+    # -----------------------------
+    def tick(self, now_ns: Optional[int] = None):
+        """Refresh sensors and counters for one frame; return (power W, estimated runtime min)"""
+        self._read_sensors()
+        self.update_runtime(now_ns)
+        power = self.load_current * self.dc_output_voltage
+        # Sign depends on the reader's current convention; an idle load has no finite runtime
+        load = abs(self.load_current)
+        if load < _MIN_LOAD_A:
+            estimated_runtime = math.inf
+        else:
+            estimated_runtime = self.battery_percentage * self.dc_output_voltage * self.dc_output_current / load
+        return power, estimated_runtime
 
     # -----------------------------
     # LED mapping
     # -----------------------------
     def led_display(self):
         """Return string showing LED battery levels and colors"""
-        leds = [
-            {"range": (76, 100), "label": "LED4", "color": "GREEN"},
-            {"range": (51, 75), "label": "LED3", "color": "YELLOW"},
-            {"range": (26, 50), "label": "LED2", "color": "ORANGE"},
-            {"range": (5, 25), "label": "LED1", "color": "RED"}
-        ]
-        output = ""
-        for led in leds:
-            if self.battery_percentage >= led["range"][0]:
-                output += color_text(f"{led['label']}: {self.battery_percentage}%", led["color"]) + "\n"
-            else:
-                output += color_text(f"{led['label']}: ---", "DIM") + "\n"
-        return output
+        percent = self.battery_percentage
+        return "".join(
+            lit % percent if percent >= threshold else dimmed
+            for threshold, lit, dimmed in self._led_templates
+        )
+
+    # -----------------------------
+    # Headless output
+    # -----------------------------
+    def log_line(self, power: float, estimated_runtime: float):
+        """Write a single uncolored status line (used when stdout is not a terminal)"""
+        ac = "AC" if self.on_ac_power else "DC"
+        sys.stdout.write(
+            f"{datetime.now().isoformat(timespec='seconds')} {ac} {self.charge_status} "
+            f"bat={self.battery_voltage:.2f}V/{self.battery_percentage}% "
+            f"load={self.load_current:.2f}A power={power:.2f}W cpu={self.cpu_temp:.1f}C "
+            f"energy={self.cumulative_energy:.3f}Wh runtime={estimated_runtime:.1f}min\n"
+        )
+        sys.stdout.flush()
 
     # -----------------------------
     # Dashboard display
     # -----------------------------
     def display_dashboard(self):
         """Print formatted UPS dashboard"""
-        os.system('clear')
-        self.update_sensors()
-        self.update_runtime()
-        header = color_text("UPS Monitor v33", "WHITE")
-        shortcuts = color_text("F1R=Refresh | F1S=Snapshot | F1Q/F1A=Quit | F1L=Launch | F1K=Keep on top", "WHITE")
-        print(header)
-        print(shortcuts)
-        print("-" * 60)
-        print(f"Voltage: {self.battery_voltage:.2f}V")
-        print(f"Battery Remaining: {self.battery_percentage}%")
-        print(self.led_display())
-        print(f"AC Input Voltage: {self.ac_input_voltage:.2f}V")
-        print(f"AC Input Current: {self.ac_input_current:.2f}A")
-        print(f"DC Output Voltage: {self.dc_output_voltage:.2f}V")
-        print(f"DC Output Current: {self.dc_output_current:.2f}A")
-        print(f"Load Current: {self.load_current:.2f}A")
-        print(f"Power Used: {self.load_current * self.dc_output_voltage:.2f} W")
-        print(f"CPU Temp: {self.cpu_temp:.1f}°C")
-        ac_status = "On AC Power (Plugged In)" if self.on_ac_power else "Off AC Power (Running on DC)"
-        print(f"AC Status: {ac_status}")
-        print(f"Charge Status: {self.charge_status}")
-        print("-" * 60)
-        print(f"Total AC Time: {self.total_ac_time:.1f}s")
-        print(f"Last Battery Time: {self.last_battery_time:.1f}s")
-        print(f"Cumulative Battery Time: {self.cumulative_battery_time:.1f}s")
-        print(f"Cumulative Energy: {self.cumulative_energy:.3f} Wh")
-        estimated_runtime = self.battery_percentage * self.dc_output_voltage * self.dc_output_current / self.load_current
-        print(f"Estimated Runtime: {estimated_runtime:.1f} min")
-        print("-" * 60)
+        power, estimated_runtime = self.tick(time.monotonic_ns())
+        if not self._tty:
+            self.log_line(power, estimated_runtime)
+            return
+        vals = {
+            "header": self._header,
+            "shortcuts": self._shortcuts,
+            "voltage": self.battery_voltage,
+            "percent": self.battery_percentage,
+            "leds": self.led_display(),
+            "ac_voltage": self.ac_input_voltage,
+            "ac_current": self.ac_input_current,
+            "dc_voltage": self.dc_output_voltage,
+            "dc_current": self.dc_output_current,
+            "load": self.load_current,
+            "power": power,
+            "cpu_temp": self.cpu_temp,
+            "ac_status": "On AC Power (Plugged In)" if self.on_ac_power else "Off AC Power (Running on DC)",
+            "charge_status": self.charge_status,
+            "total_ac_time": self.total_ac_time,
+            "last_battery_time": self.last_battery_time,
+            "cumulative_battery_time": self.cumulative_battery_time,
+            "cumulative_energy": self.cumulative_energy,
+            "estimated_runtime": estimated_runtime,
+        }
+        # Clear + whole frame rendered in one format pass and one write
+        sys.stdout.write(_DASH_TMPL.format_map(vals))
+        sys.stdout.flush()
 
     # -----------------------------
     # Run dashboard loop
@@ -159,9 +260,10 @@ class UPSMonitor:
     def run(self):
         """Run the dashboard with auto-refresh"""
         try:
+            deadline = time.monotonic() + self.refresh_interval
             while True:
                 self.display_dashboard()
-                time.sleep(self.refresh_interval)
+                deadline = sleep_until_next(deadline, self.refresh_interval)
         except KeyboardInterrupt:
             print("\nExiting UPS Monitor...")
 
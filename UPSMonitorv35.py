@@ -20,22 +20,27 @@ Features:
 - Shortcut keys: Refresh, Snapshot, Quit, Launch, Keep on top, Shutdown, Restart
 """
 
+import bisect
 import time
 import random  # Mock data, replace with actual UPS readings
 import datetime
+import functools
+import sys
 
 # =================== CONFIGURABLE OPTIONS ===================
 REFRESH_INTERVAL = 10  # seconds
 WINDOW_SIZE = (400, 300)  # width x height, for GUI if implemented
 BACKGROUND_COLOR = "black"
 BORDER_COLOR = "red"
+CLEAR_SCREEN = "\033c"  # terminal reset, sent in the same write as each frame
+IS_TTY = sys.stdout.isatty()  # headless (service/log capture) gets one plain line per refresh
 
 # =================== MOCK UPS DATA FUNCTIONS ===================
 # Replace these mocks with actual code to read from UPS HAT or ADC
 
 def get_bat_voltage() -> float:
     """Return battery voltage in volts."""
-    return round(random.uniform(3.7, 4.2), 2)
+    return random.uniform(3.7, 4.2)
 
 def get_bat_percentage() -> int:
     """Return battery percentage (0-100%)."""
@@ -43,59 +48,117 @@ def get_bat_percentage() -> int:
 
 def get_bat_current() -> float:
     """Return battery current in amperes."""
-    return round(random.uniform(0.5, 1.5), 2)
+    return random.uniform(0.5, 1.5)
 
 def get_input_voltage() -> float:
     """Return AC input voltage in volts."""
-    return round(random.uniform(5.0, 5.2), 2)
+    return random.uniform(5.0, 5.2)
 
 def get_input_current() -> float:
     """Return AC input current in amperes."""
-    return round(random.uniform(0.5, 1.0), 2)
+    return random.uniform(0.5, 1.0)
 
 def get_output_voltage() -> float:
     """Return DC output voltage in volts."""
-    return round(random.uniform(4.9, 5.1), 2)
+    return random.uniform(4.9, 5.1)
+
+_mock_output_current = 0.75  # last mocked output current, shared with get_load_current()
 
 def get_output_current() -> float:
     """Return DC output current in amperes."""
-    return round(random.uniform(0.5, 1.0), 2)
+    global _mock_output_current
+    _mock_output_current = random.uniform(0.5, 1.0)
+    return _mock_output_current
 
 def get_load_current() -> float:
-    """Return load current in amperes."""
-    return get_output_current()
+    """Return load current in amperes (mock: the output current sampled this frame)."""
+    return _mock_output_current
 
 def get_cpu_temp() -> float:
     """Return CPU temperature in Celsius."""
-    return round(random.uniform(42.0, 47.0), 1)
+    return random.uniform(42.0, 47.0)
 
 # =================== UPS STATE TRACKING ===================
 cumulative_battery_time = 0.0  # seconds
-last_battery_start = None
+last_battery_start = None  # time.monotonic_ns() when running on battery began
+last_frame_ns = None  # time.monotonic_ns() of the previous dashboard frame
 cumulative_energy = 0.0  # Wh
 last_power_event = "System startup"
 
+# =================== CALCULATIONS ===================
+# Plain scalar-in/scalar-out helpers, kept free of globals so they can be
+# called (or compiled) independently of the dashboard.
+
+def calculate_cumulative_energy(voltage: float, current: float, seconds: float) -> float:
+    """Return energy in Wh drawn at voltage * current over the given seconds."""
+    return voltage * current * (seconds / 3600)
+
+def estimate_runtime(battery_percent: float) -> float:
+    """Return estimated runtime in minutes for the given battery percentage (mock)."""
+    return battery_percent / 100 * 400
+
 # =================== DISPLAY UTILITIES ===================
+LED_BAND_THRESHOLDS = (26, 51, 76)  # percent at which the 2nd, 3rd and 4th LED light
+LED_BANDS = ((1, "red"), (2, "orange"), (3, "yellow"), (4, "green"))
+
 def map_leds(battery_percent: int):
     """Determine number of LEDs active (1-4) and their colors."""
-    if battery_percent >= 76:
-        return 4, "green"
-    elif battery_percent >= 51:
-        return 3, "yellow"
-    elif battery_percent >= 26:
-        return 2, "orange"
-    else:
-        return 1, "red"
+    return LED_BANDS[bisect.bisect_right(LED_BAND_THRESHOLDS, battery_percent)]
 
+ANSI_COLORS = {"green": "\033[92m", "yellow": "\033[93m",
+               "orange": "\033[33m", "red": "\033[91m"}
+ANSI_RESET = "\033[0m"
+
+# Inputs are a handful of labels plus "<percent>%" in 4 colors, so every
+# combination seen at runtime fits in the cache.
+@functools.lru_cache(maxsize=512)
 def color_text(text: str, color: str) -> str:
     """Return color-coded text for terminal display (mock)."""
-    colors = {"green": "\033[92m", "yellow": "\033[93m",
-              "orange": "\033[33m", "red": "\033[91m", "reset": "\033[0m"}
-    return f"{colors.get(color,'')}{text}{colors['reset']}"
+    return f"{ANSI_COLORS.get(color,'')}{text}{ANSI_RESET}"
+
+@functools.lru_cache(maxsize=128)
+def render_leds(battery_percent: int):
+    """Return (band color, colored LED4..LED1 rows); cached since percent is a small integer domain."""
+    leds_active, led_color = map_leds(battery_percent)
+    rows = []
+    for i in range(4, 0, -1):
+        if i <= leds_active:
+            line_color = led_color
+        else:
+            line_color = "green"  # dimmed inactive LEDs
+        rows.append(f"LED{i}: {color_text(str(battery_percent if i <= leds_active else '---') + '%', line_color)}")
+    return led_color, "\n".join(rows)
+
+# =================== DASHBOARD LAYOUT ===================
+# Whole frame rendered with one format_map call and written once
+DASHBOARD_TEMPLATE = (
+    "{power_event}\n"
+    "------------------------------------------------------------\n"
+    "Voltage: {voltage:.2f}V\n"
+    "Battery Remaining: {percent}\n"
+    "{leds}\n"
+    "\n"
+    "AC Input Voltage: {ac_voltage:.2f}V\n"
+    "AC Input Current: {ac_current:.2f}A\n"
+    "DC Output Voltage: {dc_voltage:.2f}V\n"
+    "DC Output Current: {dc_current:.2f}A\n"
+    "Load Current: {load:.2f}A\n"
+    "Power Used: {power:.2f} W\n"
+    "CPU Temp: {cpu_temp:.1f}°C\n"
+    "AC Status: {ac_state}\n"
+    "Charge Status: {charge_status}\n"
+    "------------------------------------------------------------\n"
+    "Total AC Time: {total_ac_time:.1f}s\n"
+    "Last Battery Time: {last_battery_time:.1f}s\n"
+    "Cumulative Battery Time: {cumulative_battery_time:.1f}s\n"
+    "Cumulative Energy: {cumulative_energy:.3f} Wh\n"
+    "Estimated Runtime: {estimated_runtime:.1f} min\n"
+    "------------------------------------------------------------\n"
+)
 
 # =================== MAIN DASHBOARD DISPLAY ===================
 def display_dashboard():
-    global last_battery_start, cumulative_battery_time, cumulative_energy, last_power_event
+    global last_battery_start, cumulative_battery_time, cumulative_energy, last_power_event, last_frame_ns
     
     voltage = get_bat_voltage()
     percent = get_bat_percentage()
@@ -106,75 +169,88 @@ def display_dashboard():
     dc_current = get_output_current()
     load = get_load_current()
     cpu_temp = get_cpu_temp()
+    now_ns = time.monotonic_ns()  # single clock read shared by all time math this frame
     
     # Determine AC/DC state
     ac_present = ac_voltage > 0
     if ac_present:
         charge_status = "Charging" if percent < 100 else "Fully charged"
         if last_battery_start:
-            duration = time.time() - last_battery_start
+            duration = (now_ns - last_battery_start) * 1e-9
             cumulative_battery_time += duration
             last_battery_start = None
         ac_state_str = "On AC Power (Plugged In)"
     else:
         charge_status = "Discharging"
         if not last_battery_start:
-            last_battery_start = time.time()
+            last_battery_start = now_ns
         ac_state_str = "Off AC Power (Running on DC)"
     
-    # Update cumulative energy (simplified)
-    cumulative_energy += dc_voltage * dc_current * (REFRESH_INTERVAL / 3600)  # Wh
+    # Update cumulative energy over the real time since the last frame (skipped ticks included)
+    elapsed = REFRESH_INTERVAL if last_frame_ns is None else (now_ns - last_frame_ns) * 1e-9
+    last_frame_ns = now_ns
+    cumulative_energy += calculate_cumulative_energy(dc_voltage, dc_current, elapsed)  # Wh
 
     # LED mapping
-    leds_active, led_color = map_leds(percent)
-    
-    # Last power event formatting
-    print(color_text(f"LAST POWER EVENT: {last_power_event}", "red"))
-    
-    # ------------------ Dashboard ------------------
-    print("------------------------------------------------------------")
-    print(f"Voltage: {voltage}V")
-    print(f"Battery Remaining: {color_text(str(percent)+'%', led_color)}")
-    
-    for i in range(4, 0, -1):
-        if i <= leds_active:
-            line_color = led_color
-        else:
-            line_color = "green"  # dimmed inactive LEDs
-        print(f"LED{i}: {color_text(str(percent if i <= leds_active else '---') + '%', line_color)}")
-    
-    print()
-    print(f"AC Input Voltage: {ac_voltage}V")
-    print(f"AC Input Current: {ac_current}A")
-    print(f"DC Output Voltage: {dc_voltage}V")
-    print(f"DC Output Current: {dc_current}A")
-    print(f"Load Current: {load}A")
-    print(f"Power Used: {round(dc_voltage*dc_current,2)} W")
-    print(f"CPU Temp: {cpu_temp}°C")
-    print(f"AC Status: {ac_state_str}")
-    print(f"Charge Status: {charge_status}")
-    print("------------------------------------------------------------")
+    led_color, leds = render_leds(percent)
     
     # Time & energy tracking
     total_ac_time = 0  # Placeholder, can track since reboot
-    last_battery_time = 0 if not last_battery_start else time.time() - last_battery_start
-    print(f"Total AC Time: {round(total_ac_time,1)}s")
-    print(f"Last Battery Time: {round(last_battery_time,1)}s")
-    print(f"Cumulative Battery Time: {round(cumulative_battery_time,1)}s")
-    print(f"Cumulative Energy: {round(cumulative_energy,3)} Wh")
-    
+    last_battery_time = 0 if not last_battery_start else (now_ns - last_battery_start) * 1e-9
+
     # Estimated runtime
-    estimated_runtime = percent / 100 * 400  # mock estimate
-    print(f"Estimated Runtime: {round(estimated_runtime,1)} min")
-    print("------------------------------------------------------------")
+    estimated_runtime = estimate_runtime(percent)
+
+    if not IS_TTY:
+        sys.stdout.write(
+            f"{datetime.datetime.now().isoformat(timespec='seconds')} {charge_status} "
+            f"bat={voltage:.2f}V/{percent}% ac={ac_voltage:.2f}V load={load:.2f}A "
+            f"power={dc_voltage*dc_current:.2f}W cpu={cpu_temp:.1f}C "
+            f"energy={cumulative_energy:.3f}Wh runtime={estimated_runtime:.1f}min\n"
+        )
+        sys.stdout.flush()
+        return
+
+    # ------------------ Dashboard ------------------
+    frame = DASHBOARD_TEMPLATE.format_map({
+        "power_event": color_text(f"LAST POWER EVENT: {last_power_event}", "red"),
+        "voltage": voltage,
+        "percent": color_text(str(percent) + '%', led_color),
+        "leds": leds,
+        "ac_voltage": ac_voltage,
+        "ac_current": ac_current,
+        "dc_voltage": dc_voltage,
+        "dc_current": dc_current,
+        "load": load,
+        "power": dc_voltage * dc_current,
+        "cpu_temp": cpu_temp,
+        "ac_state": ac_state_str,
+        "charge_status": charge_status,
+        "total_ac_time": total_ac_time,
+        "last_battery_time": last_battery_time,
+        "cumulative_battery_time": cumulative_battery_time,
+        "cumulative_energy": cumulative_energy,
+        "estimated_runtime": estimated_runtime,
+    })
+    # Clear and redraw in one write so the terminal never shows a blank screen
+    sys.stdout.write(CLEAR_SCREEN + frame)
+    sys.stdout.flush()
 
 # =================== AUTO-REFRESH LOOP ===================
+def sleep_until_next(deadline: float, interval: float) -> float:
+    """Sleep until the monotonic `deadline`, skipping missed intervals; return the next one."""
+    now = time.monotonic()
+    if now > deadline:
+        deadline += ((now - deadline) // interval + 1) * interval
+    time.sleep(deadline - now)
+    return deadline + interval
+
 def refresh_loop():
     try:
+        deadline = time.monotonic() + REFRESH_INTERVAL
         while True:
-            print("\033c", end="")  # Clear terminal
             display_dashboard()
-            time.sleep(REFRESH_INTERVAL)
+            deadline = sleep_until_next(deadline, REFRESH_INTERVAL)
     except KeyboardInterrupt:
         print("Exiting UPS Monitor...")
 